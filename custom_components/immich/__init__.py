@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_KEY, CONF_HOST, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_API_KEY, CONF_HOST, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant
 
 from .const import DOMAIN
 from .hub import ImmichHub, InvalidAuth
@@ -18,11 +18,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hub = ImmichHub(host=entry.data[CONF_HOST], hass=hass, config_entry=entry, api_key=entry.data[CONF_API_KEY])
 
-    if not await hub.authenticate():
-        raise InvalidAuth
+    try:
+        if not await hub.authenticate():
+            raise InvalidAuth
+    except Exception:
+        await hub.async_close()
+        raise
 
     hass.data[DOMAIN][entry.entry_id] = hub
 
+    async def _async_close_hub(event: Event) -> None:
+        """Close the hub session when Home Assistant shuts down."""
+        await hub.async_close()
+
+    # Config entries are not unloaded on shutdown, so close the session here too
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_hub)
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -31,6 +44,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hub: ImmichHub = hass.data[DOMAIN].pop(entry.entry_id)
+        await hub.async_close()
 
     return unload_ok
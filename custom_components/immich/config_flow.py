@@ -52,10 +52,14 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
 
     hub = ImmichHub(host=url, api_key=api_key, hass=hass, config_entry=None)
 
-    if not await hub.authenticate():
-        raise InvalidAuth
+    try:
+        if not await hub.authenticate():
+            raise InvalidAuth
+
+        user_info = await hub.get_my_user_info()
+    finally:
+        await hub.async_close()
 
-    user_info = await hub.get_my_user_info()
     username = user_info["name"]
     clean_hostname = urlparse(url).hostname
 
@@ -117,10 +121,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         api_key = self.config_entry.data[CONF_API_KEY]
         hub = ImmichHub(host=url, api_key=api_key, hass=None, config_entry=self.config_entry)
 
-        if not await hub.authenticate():
-            raise InvalidAuth
+        try:
+            if not await hub.authenticate():
+                raise InvalidAuth
+
+            albums = await hub.list_all_albums()
+        finally:
+            await hub.async_close()
 
-        albums = await hub.list_all_albums()
         album_map = {album["id"]: album["albumName"] for album in albums}
 
         current_albums_value = [
@@ -25,9 +25,17 @@ UPDATE_INTERVAL_UNITS = ["seconds", "minutes"]
 CONF_CACHE_MODE = "cache_mode"
 DEFAULT_CACHE_MODE = False
 
+# Cached assets unused for longer than this are evicted at startup (in seconds)
+ASSET_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+# Least recently used assets are evicted at startup above this size (in bytes)
+ASSET_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
 PICTURE_TYPES = ["preview", "fullsize"]
 CONF_PICTURE_TYPE = "picture_type"
 DEFAULT_PICTURE_TYPE = "preview"
 
+# Number of upcoming assets to download ahead of time
+PREFETCH_COUNT = 3
+
 # Validation for update interval (min=1 second, max=24 hours)
 UPDATE_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=86400))
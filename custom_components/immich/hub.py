@@ -1,12 +1,22 @@
 """Hub for Immich integration."""
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from contextlib import suppress
+from email.utils import formatdate
+import hashlib
 import logging
-from urllib.parse import urljoin
+from pathlib import Path
+import time
+from typing import Any
 
 import aiohttp
+from yarl import URL
 import aiofiles
+import aiofiles.os
 import os
+import orjson
 import shutil
 
 from homeassistant.config_entries import ConfigEntry
@@ -15,13 +25,23 @@ from homeassistant.core import HomeAssistant
 
 from .const import (
     CONF_CACHE_MODE, DEFAULT_CACHE_MODE,
-    CONF_PICTURE_TYPE, DEFAULT_PICTURE_TYPE
+    CONF_PICTURE_TYPE, DEFAULT_PICTURE_TYPE,
+    PREFETCH_COUNT, ASSET_CACHE_MAX_AGE, ASSET_CACHE_MAX_BYTES
 )
 
 _HEADER_API_KEY = "x-api-key"
 _LOGGER = logging.getLogger(__name__)
 
 _ALLOWED_MIME_TYPES = ["image/png", "image/jpeg"]
+_THUMBNAIL_HEADERS = {"Accept": "*/*"}
+_MEM_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_MEM_CACHE_TTL = 300
+_CACHE_CONCURRENCY = 8
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_ETAG_SUFFIX = ".etag"
+_PICTURE_TYPE_MARKER = ".picture_type"
+_USER_INFO_TTL = 60
+_ASSET_LIST_TTL = 300
 
 
 class ImmichHub:
@@ -33,48 +53,93 @@ class ImmichHub:
         self.api_key = api_key
         self.hass = hass
         self.config_entry = config_entry
+        self._base_url = URL(host).origin()
+        self._headers = {"Accept": "application/json", _HEADER_API_KEY: api_key}
+        self._session: aiohttp.ClientSession | None = None
+        self._closed = False
+        # asset_id -> (fetched at, asset bytes, ETag)
+        self._mem_cache: OrderedDict[str, tuple[float, bytes, str | None]] = OrderedDict()
+        self._mem_cache_bytes = 0
+        self._prefetch_tasks: dict[str, asyncio.Task] = {}
+        self._cache_semaphore = asyncio.Semaphore(_CACHE_CONCURRENCY)
+        self._ttl_cache: dict[str, tuple[float, Any]] = {}
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared client session, creating it on first use."""
+        if self._closed:
+            raise CannotConnect("Hub has been closed")
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                base_url=self._base_url,
+                headers=self._headers,
+                connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300, keepalive_timeout=75),
+            )
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the shared client session."""
+        self._closed = True
+        for task in self._prefetch_tasks.values():
+            task.cancel()
+        self._prefetch_tasks.clear()
+        self._ttl_cache.clear()
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_ttl_cached(self, key: str, ttl: float) -> Any | None:
+        """Return a cached API result if it is younger than ttl seconds."""
+        if (entry := self._ttl_cache.get(key)) and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    def _set_ttl_cached(self, key: str, value: Any) -> None:
+        """Store an API result in the TTL cache."""
+        self._ttl_cache[key] = (time.monotonic(), value)
 
     async def authenticate(self) -> bool:
         """Test if we can authenticate with the host."""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = urljoin(self.host, "/api/auth/validateToken")
-                headers = {"Accept": "application/json", _HEADER_API_KEY: self.api_key}
+            session = await self._get_session()
 
-                async with session.post(url=url, headers=headers) as response:
-                    if response.status != 200:
-                        raw_result = await response.text()
-                        _LOGGER.error("Error from API: body=%s", raw_result)
-                        return False
+            async with session.post("/api/auth/validateToken") as response:
+                if response.status != 200:
+                    raw_result = await response.text()
+                    _LOGGER.error("Error from API: body=%s", raw_result)
+                    return False
 
-                    auth_result = await response.json()
+                auth_result = await response.json(loads=orjson.loads)
 
-                    if not auth_result.get("authStatus"):
-                        raw_result = await response.text()
-                        _LOGGER.error("Error from API: body=%s", raw_result)
-                        return False
+                if not auth_result.get("authStatus"):
+                    raw_result = await response.text()
+                    _LOGGER.error("Error from API: body=%s", raw_result)
+                    return False
 
-                    return True
+                return True
         except aiohttp.ClientError as exception:
             _LOGGER.error("Error connecting to the API: %s", exception)
             raise CannotConnect from exception
 
     async def get_my_user_info(self) -> dict:
         """Get user info."""
+        if (cached := self._get_ttl_cached("user_info", _USER_INFO_TTL)) is not None:
+            return cached
+
         try:
-            async with aiohttp.ClientSession() as session:
-                url = urljoin(self.host, "/api/users/me")
-                headers = {"Accept": "application/json", _HEADER_API_KEY: self.api_key}
+            session = await self._get_session()
 
-                async with session.get(url=url, headers=headers) as response:
-                    if response.status != 200:
-                        raw_result = await response.text()
-                        _LOGGER.error("Error from API: body=%s", raw_result)
-                        raise ApiError()
+            async with session.get("/api/users/me") as response:
+                if response.status != 200:
+                    raw_result = await response.text()
+                    _LOGGER.error("Error from API: body=%s", raw_result)
+                    raise ApiError()
 
-                    user_info: dict = await response.json()
+                user_info: dict = await response.json(loads=orjson.loads)
 
-                    return user_info
+                self._set_ttl_cached("user_info", user_info)
+                return user_info
         except aiohttp.ClientError as exception:
             _LOGGER.error("Error connecting to the API: %s", exception)
             raise CannotConnect from exception
@@ -82,171 +147,453 @@ class ImmichHub:
     async def get_asset_info(self, asset_id: str) -> dict | None:
         """Get asset info."""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = urljoin(self.host, f"/api/assets/{asset_id}")
-                headers = {"Accept": "application/json", _HEADER_API_KEY: self.api_key}
+            session = await self._get_session()
 
-                async with session.get(url=url, headers=headers) as response:
-                    if response.status != 200:
-                        raw_result = await response.text()
-                        _LOGGER.error("Error from API: body=%s", raw_result)
-                        raise ApiError()
+            async with session.get(f"/api/assets/{asset_id}") as response:
+                if response.status != 200:
+                    raw_result = await response.text()
+                    _LOGGER.error("Error from API: body=%s", raw_result)
+                    raise ApiError()
 
-                    asset_info: dict = await response.json()
+                asset_info: dict = await response.json(loads=orjson.loads)
 
-                    return asset_info
+                return asset_info
         except aiohttp.ClientError as exception:
             _LOGGER.error("Error connecting to the API: %s", exception)
             raise CannotConnect from exception
 
+    def _remember_asset(self, asset_id: str, asset_bytes: bytes, etag: str | None = None) -> None:
+        """Store asset bytes in the in-memory LRU, evicting the oldest entries."""
+        if asset_id in self._mem_cache:
+            self._mem_cache_bytes -= len(self._mem_cache.pop(asset_id)[1])
+        self._mem_cache[asset_id] = (time.time(), asset_bytes, etag)
+        self._mem_cache_bytes += len(asset_bytes)
+        while self._mem_cache_bytes > _MEM_CACHE_MAX_BYTES and len(self._mem_cache) > 1:
+            _, (_, evicted, _) = self._mem_cache.popitem(last=False)
+            self._mem_cache_bytes -= len(evicted)
+
+    def _recall_asset(self, asset_id: str) -> bytes | None:
+        """Return asset bytes from the in-memory LRU while they are fresh."""
+        entry = self._mem_cache.get(asset_id)
+        if entry is None or time.time() - entry[0] >= _MEM_CACHE_TTL:
+            return None
+        self._mem_cache.move_to_end(asset_id)
+        return entry[1]
+
     async def download_asset(self, asset_id: str) -> bytes | None:
         """Download the asset."""
 
-        asset_bytes = await self.load_cached_asset(asset_id)
-        if asset_bytes:
+        if (asset_bytes := self._recall_asset(asset_id)) is not None:
             return asset_bytes
-        
+
+        # Wait for an in-flight prefetch of this asset instead of requesting it twice
+        task = self._prefetch_tasks.get(asset_id)
+        if task is not None and task is not asyncio.current_task():
+            await asyncio.wait((task,))
+            if (asset_bytes := self._recall_asset(asset_id)) is not None:
+                return asset_bytes
+
+        # Entries past their TTL are revalidated before being served again
+        if (entry := self._mem_cache.get(asset_id)) is not None:
+            cached_at, cached_bytes, etag = entry
+        else:
+            cached_bytes = await self.load_cached_asset(asset_id) or None
+            cached_at, etag = None, None
+            if cached_bytes:
+                # Cache files are renamed into place together with their sidecar,
+                # so a missing ETag means the server did not send one. Fall back to
+                # the time the asset was cached to revalidate those entries.
+                etag = await self._load_cached_etag(asset_id)
+                if etag is None:
+                    with suppress(OSError):
+                        cached_at = (await aiofiles.os.stat(self._cache_path(asset_id))).st_mtime
+
+        headers = _THUMBNAIL_HEADERS
+        if cached_bytes and etag:
+            headers = {**_THUMBNAIL_HEADERS, "If-None-Match": etag}
+        elif cached_bytes and cached_at is not None:
+            headers = {**_THUMBNAIL_HEADERS, "If-Modified-Since": formatdate(cached_at, usegmt=True)}
+
         picture_type = self.config_entry.options.get(CONF_PICTURE_TYPE, DEFAULT_PICTURE_TYPE)
 
         try:
-            async with aiohttp.ClientSession() as session:
+            session = await self._get_session()
+            if cached_bytes:
+                _LOGGER.debug("Revalidating cached asset with Immich: %s", asset_id)
+            else:
                 _LOGGER.info("Downloading uncached asset from Immich: %s", asset_id)
-                url = urljoin(self.host, f"/api/assets/{asset_id}/thumbnail?size={picture_type}")    
-                headers = {_HEADER_API_KEY: self.api_key}
 
-                async with session.get(url=url, headers=headers) as response:
+            async with session.get(
+                f"/api/assets/{asset_id}/thumbnail?size={picture_type}", headers=headers
+            ) as response:
+                if response.status == 304 and cached_bytes:
+                    self._remember_asset(asset_id, cached_bytes, etag)
+                    return cached_bytes
+
+                if response.status != 200:
+                    _LOGGER.error("Error from API: status=%d", response.status)
+                    return cached_bytes
+
+                if response.content_type not in _ALLOWED_MIME_TYPES:
+                    _LOGGER.error(
+                        "MIME type is not supported: %s", response.content_type
+                    )
+                    return cached_bytes
+
+                asset_bytes = await response.read()
+                etag = response.headers.get("ETag")
+                self._remember_asset(asset_id, asset_bytes, etag)
+                if cached_bytes and await aiofiles.os.path.isfile(self._cache_path(asset_id)):
+                    await self._replace_cached_asset(asset_id, asset_bytes, etag)
+                return asset_bytes
+        except aiohttp.ClientError as exception:
+            _LOGGER.error("Error connecting to the API: %s", exception)
+            if cached_bytes:
+                return cached_bytes
+            raise CannotConnect from exception
+
+    async def download_asset_to_file(self, asset_id: str, filename: Path) -> bool:
+        """Stream the asset into the disk cache without buffering it in memory.
+
+        The response is written to a temporary file that is renamed into place
+        once complete, so readers never see a partially written asset. Raises
+        FileExistsError if the asset is already being downloaded.
+        """
+
+        picture_type = self.config_entry.options.get(CONF_PICTURE_TYPE, DEFAULT_PICTURE_TYPE)
+        tmp_filename = filename.with_name(f"{asset_id}.tmp")
+
+        # Exclusive create: only one download per asset owns the temporary file
+        file = await aiofiles.open(tmp_filename, "xb")
+        renamed = False
+        try:
+            try:
+                session = await self._get_session()
+                _LOGGER.info("Downloading uncached asset from Immich: %s", asset_id)
+
+                async with session.get(
+                    f"/api/assets/{asset_id}/thumbnail?size={picture_type}", headers=_THUMBNAIL_HEADERS
+                ) as response:
                     if response.status != 200:
                         _LOGGER.error("Error from API: status=%d", response.status)
-                        return None
+                        return False
 
                     if response.content_type not in _ALLOWED_MIME_TYPES:
                         _LOGGER.error(
                             "MIME type is not supported: %s", response.content_type
                         )
-                        return None
+                        return False
 
-                    return await response.read()
+                    async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                        await file.write(chunk)
+
+                    etag = response.headers.get("ETag")
+            finally:
+                await file.close()
+
+            await self._store_cached_etag(asset_id, etag)
+            await aiofiles.os.replace(tmp_filename, filename)
+            renamed = True
+            return True
         except aiohttp.ClientError as exception:
             _LOGGER.error("Error connecting to the API: %s", exception)
             raise CannotConnect from exception
+        finally:
+            # Also runs on cancellation, so no partial download is left behind
+            if not renamed:
+                with suppress(OSError):
+                    await aiofiles.os.remove(tmp_filename)
+
+    async def prefetch(self, asset_ids: list[str], k: int = PREFETCH_COUNT) -> None:
+        """Warm the caches for the next assets in the background."""
+        if self._closed:
+            return
+
+        for asset_id in asset_ids[:k]:
+            if asset_id in self._prefetch_tasks or self._recall_asset(asset_id) is not None:
+                continue
+
+            self._prefetch_tasks[asset_id] = self.hass.async_create_background_task(
+                self._warm(asset_id), name=f"immich_prefetch_{asset_id}"
+            )
+
+    async def _warm(self, asset_id: str) -> None:
+        """Download an asset so it lands in the in-memory cache."""
+        try:
+            await self.download_asset(asset_id)
+        except CannotConnect:
+            _LOGGER.debug("Unable to prefetch asset: %s", asset_id)
+        finally:
+            self._prefetch_tasks.pop(asset_id, None)
+
+    def _cache_path(self, asset_id: str) -> Path:
+        """Return the cache file of an asset, sharded into 256 subdirectories."""
+        shard = hashlib.blake2b(asset_id.encode(), digest_size=1).hexdigest()
+        return self.asset_cache_path / shard / asset_id
 
     async def load_cached_asset(self, asset_id) -> bytes | None:
-        filename = os.path.join(self.asset_cache_path, f"{asset_id}")
-        if os.path.isfile(filename):
+        filename = self._cache_path(asset_id)
+        try:
+            async with aiofiles.open(filename, "rb") as f:
+                asset_bytes = await f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            _LOGGER.error("Unable load cached assed: %s %s", asset_id, e)
+            return None
+
+        if asset_bytes:
+            _LOGGER.info("Serving asset from cache: %s", asset_id)
+        return asset_bytes
+
+    async def _load_cached_etag(self, asset_id: str) -> str | None:
+        """Load the ETag stored alongside a cached asset."""
+        filename = self._cache_path(asset_id).with_name(f"{asset_id}{_ETAG_SUFFIX}")
+        try:
+            async with aiofiles.open(filename, "r") as f:
+                return (await f.read()).strip() or None
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            _LOGGER.error("Unable to load cached asset ETag: %s %s", asset_id, e)
+            return None
+
+    async def _store_cached_etag(self, asset_id: str, etag: str | None) -> None:
+        """Store the ETag of a cached asset, or drop a stale one."""
+        filename = self._cache_path(asset_id).with_name(f"{asset_id}{_ETAG_SUFFIX}")
+        try:
+            if etag:
+                async with aiofiles.open(filename, "w") as f:
+                    await f.write(etag)
+            else:
+                await aiofiles.os.remove(filename)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            _LOGGER.error("Unable to store cached asset ETag: %s %s", asset_id, e)
+
+    async def _replace_cached_asset(self, asset_id: str, asset_bytes: bytes, etag: str | None) -> None:
+        """Overwrite a cached asset that changed on the server."""
+        filename = self._cache_path(asset_id)
+        tmp_filename = filename.with_name(f"{asset_id}.tmp")
+        try:
+            # Exclusive create: skip the refresh if another download owns the temporary file
+            async with aiofiles.open(tmp_filename, "xb") as f:
+                await f.write(asset_bytes)
+        except FileExistsError:
+            return
+        except OSError as e:
+            _LOGGER.error("Unable to cache asset: %s %s", asset_id, e)
+            with suppress(OSError):
+                await aiofiles.os.remove(tmp_filename)
+            return
+
+        renamed = False
+        try:
+            await self._store_cached_etag(asset_id, etag)
+            await aiofiles.os.replace(tmp_filename, filename)
+            renamed = True
+            _LOGGER.info("Refreshed cached asset: %s", asset_id)
+        except OSError as e:
+            _LOGGER.error("Unable to cache asset: %s %s", asset_id, e)
+        finally:
+            if not renamed:
+                # The sidecar may already describe the new version; drop it so
+                # the old file is revalidated by modification time instead.
+                await self._store_cached_etag(asset_id, None)
+                with suppress(OSError):
+                    await aiofiles.os.remove(tmp_filename)
+
+    async def _cache_one(self, asset_id: str) -> None:
+        """Stream a single asset into the disk cache unless it is already there."""
+        async with self._cache_semaphore:
+            if self._closed:
+                return
+
+            filename = self._cache_path(asset_id)  # Optional: content_type prüfen
+            # Assets only appear under their final name once fully written, so
+            # an existing file is complete and is never read back or rewritten.
+            if await aiofiles.os.path.isfile(filename):
+                return
+
             try:
-                async with aiofiles.open(filename, "rb") as f:
-                    _LOGGER.info("Serving asset from cache: %s", asset_id)
-                    return await f.read()
+                await aiofiles.os.makedirs(filename.parent, exist_ok=True)
+                if await self.download_asset_to_file(asset_id, filename):
+                    _LOGGER.info("Cached asset: %s", asset_id)
+            except FileExistsError:
+                # Another task holds the temporary file and is downloading it
+                return
             except Exception as e:
-                _LOGGER.error("Unable load cached assed: %s %s", asset_id, e)
-        return None
+                _LOGGER.error("Unable to cache asset: %s %s", asset_id, e)
 
     async def cache_album_assets(self, album_assets: list[str]) -> None:
         """Cache album assets."""
 
-        if self.cache_assets:
-            for asset_id in album_assets:
-                filename = os.path.join(self.asset_cache_path, f"{asset_id}")  # Optional: content_type prüfen
-                if not os.path.isfile(filename):
-                    asset_bytes = await self.download_asset(asset_id)
-                    if asset_bytes:
-                        try:
-                            async with aiofiles.open(filename, "wb") as f:
-                                _LOGGER.info("Caching asset: %s", asset_id)
-                                await f.write(asset_bytes)
-                        except Exception as e:
-                            _LOGGER.error("Unable to cache asset: %s %s", asset_id, e)
-
-    def initialize_asset_cache(self) -> None:
+        if not self.cache_assets:
+            return
+
+        # _cache_one logs and swallows its own errors
+        await asyncio.gather(*(self._cache_one(asset_id) for asset_id in album_assets))
+
+    async def initialize_asset_cache(self) -> None:
         self.cache_assets = self.config_entry.options.get(CONF_CACHE_MODE, DEFAULT_CACHE_MODE)
-        self.asset_cache_path = self.hass.config.path('immich_cache')
-        
-        if os.path.isdir(self.asset_cache_path):
+        self.asset_cache_path = Path(self.hass.config.path('immich_cache'))
+        picture_type = self.config_entry.options.get(CONF_PICTURE_TYPE, DEFAULT_PICTURE_TYPE)
+        marker = self.asset_cache_path / _PICTURE_TYPE_MARKER
+
+        try:
+            async with aiofiles.open(marker, "r") as f:
+                cached_picture_type = (await f.read()).strip()
+        except OSError:
+            cached_picture_type = None
+
+        # Keep cached assets across restarts unless caching was turned off or
+        # they were downloaded with a different picture type.
+        if await aiofiles.os.path.isdir(self.asset_cache_path) and (
+            not self.cache_assets or cached_picture_type != picture_type
+        ):
             try:
-                shutil.rmtree(self.asset_cache_path)
+                await self.hass.async_add_executor_job(shutil.rmtree, self.asset_cache_path)
                 _LOGGER.info("Cleared asset cache")
             except Exception as e:
                 _LOGGER.error("Unable to clear asset cache directory: %s", e)
 
         if self.cache_assets:
             try:
-                os.makedirs(self.asset_cache_path, exist_ok=True)
-                _LOGGER.info("Created asset cache directory: ", self.asset_cache_path)
+                await aiofiles.os.makedirs(self.asset_cache_path, exist_ok=True)
+                async with aiofiles.open(marker, "w") as f:
+                    await f.write(picture_type)
+                _LOGGER.info("Created asset cache directory: %s", self.asset_cache_path)
             except Exception as e:
                 _LOGGER.error("Unable to create asset cache directory: %s %s", self.asset_cache_path, e)
+                return
+
+            try:
+                await self.hass.async_add_executor_job(self._prune_asset_cache)
+            except OSError as e:
+                _LOGGER.error("Unable to prune asset cache directory: %s", e)
+
+    def _prune_asset_cache(self) -> None:
+        """Evict cached assets that are stale or exceed the size budget."""
+        cutoff = time.time() - ASSET_CACHE_MAX_AGE
+        entries: list[tuple[float, int, str]] = []
+        evicted = 0
+
+        with os.scandir(self.asset_cache_path) as shards:
+            for shard in shards:
+                if shard.name.startswith("."):
+                    continue
+
+                if not shard.is_dir():
+                    # Left over from the flat, unsharded cache layout
+                    _remove_cache_entry(shard.path)
+                    evicted += 1
+                    continue
+
+                with os.scandir(shard.path) as it:
+                    for entry in it:
+                        if entry.name.endswith(_ETAG_SUFFIX) or not entry.is_file():
+                            continue
+
+                        stat = entry.stat()
+                        last_used = max(stat.st_atime, stat.st_mtime)
+                        if entry.name.endswith(".tmp") or last_used < cutoff:
+                            _remove_cache_entry(entry.path)
+                            evicted += 1
+                        else:
+                            entries.append((last_used, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= ASSET_CACHE_MAX_BYTES:
+                break
+            _remove_cache_entry(path)
+            total_bytes -= size
+            evicted += 1
+
+        _LOGGER.info("Pruned %d cached assets, %d bytes remain", evicted, total_bytes)
 
     async def list_favorite_images(self) -> list[dict]:
         """List all favorite images."""
-        try:
-            async with aiohttp.ClientSession() as session:
-                url = urljoin(self.host, "/api/search/metadata")
-                headers = {"Accept": "application/json", _HEADER_API_KEY: self.api_key}
-                data = {"isFavorite": "true"}
+        if (cached := self._get_ttl_cached("favorite_images", _ASSET_LIST_TTL)) is not None:
+            return cached
 
-                async with session.post(url=url, headers=headers, data=data) as response:
-                    if response.status != 200:
-                        raw_result = await response.text()
-                        _LOGGER.error("Error from API: body=%s", raw_result)
-                        raise ApiError()
+        try:
+            session = await self._get_session()
+            data = {"isFavorite": "true", "type": "IMAGE"}
 
-                    favorites = await response.json()
-                    assets: list[dict] = favorites["assets"]["items"]
+            async with session.post("/api/search/metadata", data=data) as response:
+                if response.status != 200:
+                    raw_result = await response.text()
+                    _LOGGER.error("Error from API: body=%s", raw_result)
+                    raise ApiError()
 
-                    filtered_assets: list[dict] = [
-                        asset for asset in assets if asset["type"] == "IMAGE"
-                    ]
+                favorites = await response.json(loads=orjson.loads)
+                assets: list[dict] = favorites["assets"]["items"]
 
-                    return filtered_assets
+                self._set_ttl_cached("favorite_images", assets)
+                return assets
         except aiohttp.ClientError as exception:
             _LOGGER.error("Error connecting to the API: %s", exception)
             raise CannotConnect from exception
 
     async def list_all_albums(self) -> list[dict]:
         """List all albums."""
+        if (cached := self._get_ttl_cached("albums", _ASSET_LIST_TTL)) is not None:
+            return cached
+
         try:
-            async with aiohttp.ClientSession() as session:
-                url = urljoin(self.host, "/api/albums")
-                headers = {"Accept": "application/json", _HEADER_API_KEY: self.api_key}
+            session = await self._get_session()
 
-                async with session.get(url=url, headers=headers) as response:
-                    if response.status != 200:
-                        raw_result = await response.text()
-                        _LOGGER.error("Error from API: body=%s", raw_result)
-                        raise ApiError()
+            async with session.get("/api/albums") as response:
+                if response.status != 200:
+                    raw_result = await response.text()
+                    _LOGGER.error("Error from API: body=%s", raw_result)
+                    raise ApiError()
 
-                    album_list: list[dict] = await response.json()
+                album_list: list[dict] = await response.json(loads=orjson.loads)
 
-                    return album_list
+                self._set_ttl_cached("albums", album_list)
+                return album_list
         except aiohttp.ClientError as exception:
             _LOGGER.error("Error connecting to the API: %s", exception)
             raise CannotConnect from exception
 
     async def list_album_images(self, album_id: str) -> list[dict]:
         """List all images in an album."""
+        if (cached := self._get_ttl_cached(f"album_images_{album_id}", _ASSET_LIST_TTL)) is not None:
+            return cached
+
         try:
-            async with aiohttp.ClientSession() as session:
-                url = urljoin(self.host, f"/api/albums/{album_id}")
-                headers = {"Accept": "application/json", _HEADER_API_KEY: self.api_key}
+            session = await self._get_session()
 
-                async with session.get(url=url, headers=headers) as response:
-                    if response.status != 200:
-                        raw_result = await response.text()
-                        _LOGGER.error("Error from API: body=%s", raw_result)
-                        raise ApiError()
+            async with session.get(f"/api/albums/{album_id}") as response:
+                if response.status != 200:
+                    raw_result = await response.text()
+                    _LOGGER.error("Error from API: body=%s", raw_result)
+                    raise ApiError()
 
-                    album_info: dict = await response.json()
-                    assets: list[dict] = album_info["assets"]
+                album_info: dict = await response.json(loads=orjson.loads)
+                assets: list[dict] = album_info["assets"]
 
-                    filtered_assets: list[dict] = [
-                        asset for asset in assets if asset["type"] == "IMAGE"
-                    ]
+                filtered_assets: list[dict] = [
+                    asset for asset in assets if asset["type"] == "IMAGE"
+                ]
 
-                    return filtered_assets
+                self._set_ttl_cached(f"album_images_{album_id}", filtered_assets)
+                return filtered_assets
         except aiohttp.ClientError as exception:
             _LOGGER.error("Error connecting to the API: %s", exception)
             raise CannotConnect from exception
 
 
+def _remove_cache_entry(path: str) -> None:
+    """Remove a cached asset and its ETag sidecar."""
+    for filename in (path, f"{path}{_ETAG_SUFFIX}"):
+        with suppress(FileNotFoundError):
+            os.remove(filename)
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
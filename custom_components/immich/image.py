@@ -6,7 +6,6 @@ from io import BytesIO
 
 from homeassistant.components.image import ImageEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_KEY, CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_time_interval
@@ -16,7 +15,8 @@ from .const import (
     CONF_UPDATE_INTERVAL, CONF_UPDATE_INTERVAL_UNIT,
     DEFAULT_CROP_MODE, DEFAULT_IMAGE_SELECTION_MODE,
     DEFAULT_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_UNIT,
-    CONF_CACHE_MODE, DEFAULT_CACHE_MODE
+    CONF_CACHE_MODE, DEFAULT_CACHE_MODE,
+    PREFETCH_COUNT
 )
 from .hub import ImmichHub
 from .coordinator import process_images_for_slideshow
@@ -29,9 +29,8 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Immich image platform."""
-    hub = ImmichHub(
-        host=config_entry.data[CONF_HOST], hass=hass, config_entry=config_entry, api_key=config_entry.data[CONF_API_KEY]
-    )
+    hub: ImmichHub = hass.data[DOMAIN][config_entry.entry_id]
+    await hub.initialize_asset_cache()
 
     update_interval = config_entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
     update_interval_unit = config_entry.options.get(CONF_UPDATE_INTERVAL_UNIT, DEFAULT_UPDATE_INTERVAL_UNIT)
@@ -71,6 +70,7 @@ class BaseImmichImage(ImageEntity):
         self._current_image_bytes: bytes | None = None
         self._cached_available_asset_ids: list[str] | None = None
         self._available_asset_ids_last_updated: datetime | None = None
+        self._upcoming_asset_ids: list[str] | None = None
         self._attr_extra_state_attributes = {}
         self._unsub_interval = None
 
@@ -118,6 +118,7 @@ class BaseImmichImage(ImageEntity):
         ):
             self._cached_available_asset_ids = await self._refresh_available_asset_ids()
             self._available_asset_ids_last_updated = datetime.now()
+            self._upcoming_asset_ids = None
 
         if not self._cached_available_asset_ids:
             _LOGGER.error("No assets are available")
@@ -129,7 +130,10 @@ class BaseImmichImage(ImageEntity):
         num_images = 2 if crop_mode == "Combine images" else 1
 
         if image_selection_mode == "Random":
-            return random.sample(self._cached_available_asset_ids, num_images)
+            # Draw the following selection up front so it can be prefetched
+            selected_ids = self._upcoming_asset_ids or random.sample(self._cached_available_asset_ids, num_images)
+            self._upcoming_asset_ids = random.sample(self._cached_available_asset_ids, num_images)
+            return selected_ids
         else:  # Sequential
             start_index = self._attr_extra_state_attributes.get("last_index", -1) + 1
             selected_ids = self._cached_available_asset_ids[start_index:start_index + num_images]
@@ -138,6 +142,23 @@ class BaseImmichImage(ImageEntity):
             self._attr_extra_state_attributes["last_index"] = (start_index + num_images - 1) % len(self._cached_available_asset_ids)
             return selected_ids
 
+    def _get_upcoming_asset_ids(self) -> list[str]:
+        """Get the asset ids that will most likely be displayed next."""
+        if not self._cached_available_asset_ids:
+            return []
+
+        image_selection_mode = self.config_entry.options.get(CONF_IMAGE_SELECTION_MODE, DEFAULT_IMAGE_SELECTION_MODE)
+
+        if image_selection_mode == "Random":
+            return self._upcoming_asset_ids or []
+
+        start_index = self._attr_extra_state_attributes.get("last_index", -1) + 1
+        count = min(PREFETCH_COUNT, len(self._cached_available_asset_ids))
+        return [
+            self._cached_available_asset_ids[(start_index + i) % len(self._cached_available_asset_ids)]
+            for i in range(count)
+        ]
+
     async def _load_and_cache_next_image(self) -> None:
         """Download, process, and cache the image."""
         asset_ids = await self._get_next_asset_ids()
@@ -154,6 +175,8 @@ class BaseImmichImage(ImageEntity):
             else:
                 _LOGGER.warning(f"Failed to download asset with ID: {asset_id}")
 
+        await self.hub.prefetch(self._get_upcoming_asset_ids())
+
         if not asset_bytes_list:
             _LOGGER.error("Failed to download any images")
             return
@@ -204,7 +227,6 @@ class ImmichImageAlbum(BaseImmichImage):
         self._album_id = album_id
         self._attr_unique_id = f"{config_entry.entry_id}_{album_id}"
         self._attr_name = f"Immich: {album_name}"
-        self.hub.initialize_asset_cache()
 
     async def _refresh_available_asset_ids(self) -> list[str] | None:
         """Refresh the list of available asset IDs."""